@@ -1,172 +1,474 @@
 #!/usr/bin/env python3
 import os
+import re
 import json
+import logging
 import time
+import hashlib
+import asyncio
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Dict, Iterator, List, Optional, Union
 from ddgs import DDGS
 
+logger = logging.getLogger(__name__)
+
+
+class OllamaError(Exception):
+    """Ollama failed or gave no usable answer; the movie is left unchecked and asked again next run"""
+
 class MovieChecker:
+    YES_TOKENS = frozenset({'yes', 'y'})
+    NO_TOKENS = frozenset({'no', 'n'})
+    YES_RE = re.compile(r'\byes\b', re.IGNORECASE)
+    NO_RE = re.compile(r'\bno\b', re.IGNORECASE)
+    
+    # Release-name noise stripped before titles are used as decision cache keys; the year stays,
+    # it is what tells apart different films sharing a title
+    _BRACKETED_RE = re.compile(r'\[[^\]]*\]|\{[^}]*\}')
+    _YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+    _RELEASE_TAGS_RE = re.compile(
+        r'\b(?:480p|576p|720p|1080p|2160p|4k|uhd|hdr|web-?dl|webrip|bluray|blu-ray|brrip|bdrip|'
+        r'dvdrip|hdrip|hdtv|remux|x26[45]|h[ .]?26[45]|hevc|xvid|aac|ac3|dts)\b.*$',
+        re.IGNORECASE
+    )
+    
+    # Sent as the system message of every request; keeping it byte-identical lets
+    # Ollama reuse the KV cache for this prefix instead of re-evaluating it per movie
+    SYSTEM_PROMPT = """You determine whether movies are Bollywood, Indian, or Telugu speaking movies. You will be given a movie name and DuckDuckGo search results about it.
+
+If the search results don't provide clear information, use your internal knowledge about the movie. If you still don't have enough information, make an educated guess based on the movie title, any patterns you recognize, or common characteristics.
+
+Answer with just 'yes' or 'no'. No explanations, comments, nothing. Just one word: 'yes' or 'no'."""
+    
+    BATCH_SYSTEM_PROMPT = """You determine whether movies are Bollywood, Indian, or Telugu speaking movies. You will be given several movies, each with DuckDuckGo search results about it.
+
+If the search results don't provide clear information, use your internal knowledge about the movie. If you still don't have enough information, make an educated guess based on the movie title, any patterns you recognize, or common characteristics.
+
+Answer with JSON only, one entry per movie in the order given, using the movie names exactly as written:
+{"movies": [{"name": "<movie name>", "indian": true or false}]}"""
+    
     def __init__(self):
         self.movies_dir = os.environ.get('MOVIES_DIR', '/movies')
         self.checked_dir = os.environ.get('CHECKED_DIR', '/checked')
         self.ollama_endpoint = os.environ.get('OLLAMA_ENDPOINT', 'http://localhost:11434')
         self.ollama_model = os.environ.get('OLLAMA_MODEL', 'llama3.2')
+        self.ollama_num_parallel = max(1, int(os.environ.get('OLLAMA_NUM_PARALLEL', '4')))
+        self.ollama_batch_size = max(1, int(os.environ.get('OLLAMA_BATCH_SIZE', '10')))
+        self.search_workers = max(1, int(os.environ.get('SEARCH_WORKERS', '8')))
+        self.rate_limit = float(os.environ.get('RATE_LIMIT', '5'))
         self.ntfy_url = os.environ.get('NTFY_URL', 'https://ntfy.sh/mytopic')
         self.delete_enabled = os.environ.get('DELETE', 'false').lower() == 'true'
         self.radarr_url = os.environ.get('RADARR_URL', 'http://localhost:7878')
         self.radarr_api_key = os.environ.get('RADARR_API_KEY', '')
+        self._radarr_movies: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
+        self._radarr_lock = threading.Lock()
+        self.checked_cache_path = os.path.join(self.checked_dir, 'checked.json')
+        self.checked: Dict[str, float] = {}
+        self._checked_lock = threading.Lock()
+        self.search_cache_dir = os.path.join(self.checked_dir, '.ddg_cache')
+        self.search_cache_ttl = 7 * 24 * 3600  # 7 days
+        self.decisions_path = os.path.join(self.checked_dir, 'decisions.json')
+        self.all_decisions: Dict[str, Dict[str, bool]] = {}
+        self.decisions: Dict[str, bool] = {}
+        # Language tags or Indic script (Devanagari through Malayalam) in a title are conclusive
+        self._indian_regex = re.compile(
+            r'\b(?:Telugu|Tamil|Hindi|Bollywood|Tollywood|Malayalam|Kannada|Punjabi)\b|[\u0900-\u0D7F]',
+            re.IGNORECASE
+        )
         
-        print(f"Configuration:")
-        print(f"  Movies directory: {self.movies_dir}")
-        print(f"  Checked directory: {self.checked_dir}")
-        print(f"  Ollama endpoint: {self.ollama_endpoint}")
-        print(f"  Ollama model: {self.ollama_model}")
-        print(f"  NTFY URL: {self.ntfy_url}")
-        print(f"  Delete enabled: {self.delete_enabled}")
-        print(f"  Radarr URL: {self.radarr_url}")
-        print(f"  Radarr API key: {'*' * len(self.radarr_api_key) if self.radarr_api_key else 'Not set'}")
-        print()
-        
-        # Ensure checked directory exists
-        Path(self.checked_dir).mkdir(parents=True, exist_ok=True)
-    
-    def get_movie_folders(self) -> List[str]:
-        """Get all movie folders from the movies directory"""
+        logger.info("Configuration:")
+        logger.info(f"  Movies directory: {self.movies_dir}")
+        logger.info(f"  Checked directory: {self.checked_dir}")
+        logger.info(f"  Ollama endpoint: {self.ollama_endpoint}")
+        logger.info(f"  Ollama model: {self.ollama_model}")
+        logger.info(f"  Ollama parallel requests: {self.ollama_num_parallel}")
+        logger.info(f"  Ollama batch size: {self.ollama_batch_size}")
+        logger.info(f"  Search workers: {self.search_workers}")
+        logger.info(f"  Rate limit: {f'{self.rate_limit:g} requests/second' if self.rate_limit > 0 else 'Disabled'}")
+        logger.info(f"  NTFY URL: {self.ntfy_url}")
+        logger.info(f"  Delete enabled: {self.delete_enabled}")
+        logger.info(f"  Radarr URL: {self.radarr_url}")
+        logger.info(f"  Radarr API key: {'*' * len(self.radarr_api_key) if self.radarr_api_key else 'Not set'}")
+        
+        # Static parts of the Ollama requests; only the user message changes per call
+        self._ollama_payload_template = {
+            "model": self.ollama_model,
+            "messages": [{"role": "system", "content": self.SYSTEM_PROMPT}],
+            "stream": False,
+            # A one-word answer needs only a few greedy tokens
+            "options": {"num_predict": 4, "temperature": 0, "top_k": 1},
+            # Keep the model loaded between movies instead of reloading it
+            "keep_alive": "30m"
+        }
+        self._ollama_batch_payload_template = {
+            "model": self.ollama_model,
+            "messages": [{"role": "system", "content": self.BATCH_SYSTEM_PROMPT}],
+            "format": "json",
+            "stream": False,
+            # No num_predict cap here, the JSON answer grows with the batch
+            "options": {"temperature": 0, "top_k": 1},
+            "keep_alive": "30m"
+        }
+        
+        # Token bucket shared by all threads making calls to DuckDuckGo, NTFY and Radarr
+        self._bucket = {'tokens': max(self.rate_limit, 1), 'last': time.monotonic()}
+        self._bucket_lock = threading.Lock()
+        
+        # One pooled session for Ollama, NTFY and Radarr; urllib3 handles retries with backoff
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[408, 429, 500, 502, 503, 504],
+                # POST is retried too, but only on connection errors and the statuses above: a read
+                # timeout may come after the server acted (an NTFY message already sent, a hung
+                # Ollama generation), so those are never repeated
+                read=False,
+                allowed_methods=["GET", "POST", "DELETE"]
+            )
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
+        # Ensure checked and search cache directories exist
+        Path(self.search_cache_dir).mkdir(parents=True, exist_ok=True)
+        self._load_decisions()
+    
+    @classmethod
+    def _normalize(cls, movie_name: str) -> str:
+        """Reduce a folder or release name to a lowercase 'title year' key
+
+        >>> MovieChecker._normalize('War.2019.1080p.WEB-DL.H.264-GRP')
+        'war 2019'
+        >>> MovieChecker._normalize('War (2019) [YTS]')
+        'war 2019'
+        >>> MovieChecker._normalize('A Proper Villain (2021)')
+        'a proper villain 2021'
+        >>> MovieChecker._normalize('Movie Name (2020) H.264')
+        'movie name 2020'
+        >>> MovieChecker._normalize('2012 (2009)')
+        '2012 2009'
+        """
+        title = cls._BRACKETED_RE.sub(' ', movie_name.replace('.', ' ').replace('_', ' '))
+        title = title.replace('(', ' ').replace(')', ' ')
+        
+        # Take the year out first, so no tag stripping can ever remove it; whatever
+        # follows the year in a release name is tags and release group
+        year = ''
+        years = [m for m in cls._YEAR_RE.finditer(title) if title[:m.start()].strip()]
+        if years:
+            year = years[-1].group()
+            title = title[:years[-1].start()]
+        
+        title = cls._RELEASE_TAGS_RE.sub('', title).strip(' -')
+        title = ' '.join(f"{title} {year}".split()).lower()
+        return title or movie_name.lower()
+    
+    def _load_decisions(self):
+        """Load Ollama decisions remembered from previous runs with the current model"""
         try:
-            print(f"Scanning movies directory: {self.movies_dir}")
-            folders = [f for f in os.listdir(self.movies_dir) 
-                      if os.path.isdir(os.path.join(self.movies_dir, f))]
-            print(f"Found {len(folders)} movie folders")
-            return folders
+            if os.path.exists(self.decisions_path):
+                stored = json.loads(Path(self.decisions_path).read_text())
+                # Decisions are grouped by model, so switching OLLAMA_MODEL starts from scratch
+                self.all_decisions = {model: decisions for model, decisions in stored.items()
+                                      if isinstance(decisions, dict)}
         except Exception as e:
-            print(f"Error scanning movies directory: {e}")
-            return []
+            logger.error(f"Error reading decisions cache: {e}")
+        self.decisions = self.all_decisions.setdefault(self.ollama_model, {})
+        logger.info(f"Loaded {len(self.decisions)} remembered decisions for {self.ollama_model}")
     
-    def get_checked_movies(self) -> Set[str]:
-        """Get set of already checked movies"""
-        checked = set()
+    def _save_decisions(self):
+        """Persist Ollama decisions for later runs"""
         try:
-            for file in os.listdir(self.checked_dir):
-                if file.endswith('.checked'):
-                    checked.add(file[:-8])  # Remove .checked extension
-            print(f"Found {len(checked)} already checked movies")
-            return checked
+            self._write_json_atomic(self.decisions_path, self.all_decisions)
         except Exception as e:
-            print(f"Error reading checked directory: {e}")
-            return set()
+            logger.error(f"Error saving decisions cache: {e}")
     
-    def is_movie_checked(self, movie_name: str) -> bool:
-        """Check if a movie has already been processed"""
-        checked_file = os.path.join(self.checked_dir, f"{movie_name}.checked")
-        return os.path.exists(checked_file)
+    def get_movie_folders(self) -> Iterator[str]:
+        """Yield movie folders from the movies directory as they are read"""
+        try:
+            logger.info(f"Scanning movies directory: {self.movies_dir}")
+            with os.scandir(self.movies_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry.name
+        except Exception as e:
+            logger.error(f"Error scanning movies directory: {e}")
+    
+    def get_checked_movies(self) -> Dict[str, float]:
+        """Get already checked movies, mapped to the time they were checked"""
+        try:
+            if os.path.exists(self.checked_cache_path):
+                self.checked = json.loads(Path(self.checked_cache_path).read_text())
+            else:
+                self.checked = self._migrate_legacy_checked()
+            logger.info(f"Found {len(self.checked)} already checked movies")
+        except Exception as e:
+            logger.error(f"Error reading checked movies cache: {e}")
+        return self.checked
+    
+    def _migrate_legacy_checked(self) -> Dict[str, float]:
+        """Import the per-movie .checked files into the JSON cache (first run only)"""
+        with os.scandir(self.checked_dir) as entries:
+            checked = {e.name[:-8]: e.stat().st_mtime for e in entries if e.name.endswith('.checked')}
+        if checked:
+            logger.info(f"Migrating {len(checked)} legacy .checked files to {self.checked_cache_path}")
+        self._write_json_atomic(self.checked_cache_path, checked)
+        return checked
+    
+    def _write_json_atomic(self, path: str, data: Any):
+        """Write JSON to a temporary file, then rename it over the target"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
     
     def mark_movie_checked(self, movie_name: str):
         """Mark a movie as checked"""
-        checked_file = os.path.join(self.checked_dir, f"{movie_name}.checked")
         try:
-            with open(checked_file, 'w') as f:
-                f.write(str(time.time()))
-            print(f"  Marked '{movie_name}' as checked")
+            # Movies are marked from several threads; serialise updates and rewrites of the cache
+            with self._checked_lock:
+                self.checked[movie_name] = time.time()
+                self._write_json_atomic(self.checked_cache_path, self.checked)
+            logger.info(f"  Marked '{movie_name}' as checked")
         except Exception as e:
-            print(f"  Error marking movie as checked: {e}")
+            logger.error(f"  Error marking movie as checked: {e}")
+    
+    def _throttle(self):
+        """Wait for a token before an outbound call; bursts pass, sustained traffic is held to RATE_LIMIT"""
+        if self.rate_limit <= 0:
+            return
+        with self._bucket_lock:
+            now = time.monotonic()
+            tokens = min(max(self.rate_limit, 1),
+                         self._bucket['tokens'] + (now - self._bucket['last']) * self.rate_limit)
+            if tokens < 1:
+                # Sleeping under the lock queues the other callers behind this one
+                time.sleep((1 - tokens) / self.rate_limit)
+                tokens = 1
+                now = time.monotonic()
+            self._bucket['tokens'] = tokens - 1
+            self._bucket['last'] = now
+    
+    def _search_cache_file(self, search_query: str) -> str:
+        """Path of the cache file holding the results for a search query"""
+        digest = hashlib.sha256(search_query.encode('utf-8')).hexdigest()
+        return os.path.join(self.search_cache_dir, f"{digest}.txt")
+    
+    def _read_search_cache(self, search_query: str) -> Optional[str]:
+        """Get cached search results, or None if missing or expired"""
+        cache_file = self._search_cache_file(search_query)
+        try:
+            if time.time() - os.stat(cache_file).st_mtime > self.search_cache_ttl:
+                return None
+            return Path(cache_file).read_text()
+        except OSError:
+            return None
+    
+    def _write_search_cache(self, search_query: str, search_results: str):
+        """Store search results for a query"""
+        cache_file = self._search_cache_file(search_query)
+        try:
+            tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+            Path(tmp_file).write_text(search_results)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.error(f"  Error caching search results: {e}")
+    
+    def _prune_search_cache(self):
+        """Delete cached search results older than the TTL, and leftover temporary files"""
+        removed = 0
+        try:
+            cutoff = time.time() - self.search_cache_ttl
+            with os.scandir(self.search_cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.tmp') or entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+        except OSError as e:
+            logger.error(f"Error pruning search cache: {e}")
+        if removed:
+            logger.info(f"Removed {removed} expired search cache entries")
     
-    def ask_ollama(self, movie_name: str) -> bool:
-        """Ask Ollama if the movie is Bollywood/Indian/Telugu"""
-        # First, search DuckDuckGo for movie origin information
+    def _ddg_search(self, movie_name: str) -> str:
+        """Search DuckDuckGo for movie origin information, formatted for the prompt"""
         search_query = f"{movie_name} movie country origin"
-        search_results = ""
+        search_results = self._read_search_cache(search_query)
+        
+        if search_results is not None:
+            logger.debug("  Using cached DuckDuckGo results for '%s'", search_query)
+            return search_results
         
         try:
-            print(f"  Searching DuckDuckGo for '{search_query}' with region 'us-en'...")
-            with DDGS() as ddgs:
-                results = list(ddgs.text(search_query, region='us-en', safesearch='off', max_results=5))
+            logger.debug("  Searching DuckDuckGo for '%s' with region 'us-en'...", search_query)
+            self._throttle()
+            with DDGS(timeout=5) as ddgs:
+                results = list(ddgs.text(search_query, region='us-en', safesearch='off',
+                                         max_results=3, backend='duckduckgo'))
+                # Short snippets keep the prompt small, which cuts Ollama's prompt evaluation time
                 search_results = "\n\n".join([
-                    f"Result {i+1}:\nTitle: {r.get('title', 'N/A')}\nSnippet: {r.get('body', 'N/A')}\nURL: {r.get('href', 'N/A')}"
+                    f"Result {i+1}:\nTitle: {r.get('title', 'N/A')}\nSnippet: {r.get('body', 'N/A')[:300]}\nURL: {r.get('href', 'N/A')}"
                     for i, r in enumerate(results)
                 ])
-            print(f"  Found {len(results)} search results")
+            logger.debug("  Found %d search results for '%s'", len(results), movie_name)
+            if results:
+                self._write_search_cache(search_query, search_results)
+            return search_results
         except Exception as e:
-            print(f"  Error searching DuckDuckGo: {e}")
-            search_results = "No search results available."
+            logger.error(f"  Error searching DuckDuckGo: {e}")
+            return "No search results available."
+    
+    def _parse_answer(self, answer: str) -> Optional[bool]:
+        """Read a yes/no answer from Ollama, or None if it contains neither"""
+        # The model is told to answer with one word, so the first token nearly always decides
+        first_token = (answer.strip().lower().split() or [""])[0].strip(".,!'\"")
+        if first_token in self.YES_TOKENS:
+            return True
+        if first_token in self.NO_TOKENS:
+            return False
+        
+        # Otherwise the first whole-word yes or no wins ("anonymous" is not a no)
+        yes_match = self.YES_RE.search(answer)
+        no_match = self.NO_RE.search(answer)
+        if yes_match and no_match:
+            return yes_match.start() < no_match.start()
+        if yes_match or no_match:
+            return yes_match is not None
+        return None
+    
+    def ask_ollama(self, movie_name: str, search_results: Optional[str] = None) -> bool:
+        """Ask Ollama if the movie is Bollywood/Indian/Telugu; raises if there is no clear answer"""
+        cache_key = self._normalize(movie_name)
+        if cache_key in self.decisions:
+            logger.debug("  Using remembered decision for '%s'", movie_name)
+            return self.decisions[cache_key]
+        
+        if search_results is None:
+            search_results = self._ddg_search(movie_name)
         
         # Now ask Ollama with the search results
-        prompt = f"""Based on the following DuckDuckGo search results about the movie '{movie_name}', determine if this is a Bollywood, Indian, or Telugu speaking movie.
-
-Search Results:
-{search_results}
-
-If the search results don't provide clear information, use your internal knowledge about the movie. If you still don't have enough information, make an educated guess based on the movie title, any patterns you recognize, or common characteristics.
-
-Is '{movie_name}' a Bollywood, Indian, or Telugu speaking movie? Answer with just 'yes' or 'no'. No explanations, comments, nothing. Just one word: 'yes' or 'no'."""
+        prompt = f"Movie: {movie_name}\n\nSearch Results:\n{search_results}"
+        
+        logger.info(f"  Asking Ollama about '{movie_name}'...")
+        logger.debug("  === PROMPT ===\n%s\n  === END PROMPT ===", prompt)
+        
+        payload = {
+            **self._ollama_payload_template,
+            "messages": [self._ollama_payload_template["messages"][0], {"role": "user", "content": prompt}]
+        }
+        # Transport errors propagate as requests exceptions once urllib3 has used up its retries
+        response = self.http.post(
+            f"{self.ollama_endpoint}/api/chat",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=30
+        )
         
-        max_retries = 3
-        for attempt in range(max_retries):
+        if response.status_code != 200:
+            raise OllamaError(f"Error from Ollama: {response.status_code}")
+        
+        result = response.json()
+        answer = result.get('message', {}).get('content', '').strip()
+        logger.debug("  === OLLAMA RESPONSE ===\n%s\n  === END RESPONSE ===", answer)
+        
+        is_indian = self._parse_answer(answer)
+        if is_indian is None:
+            raise OllamaError(f"Invalid response (no 'yes' or 'no' found): {answer}")
+        
+        logger.info(f"  Decision for '{movie_name}': {'yes' if is_indian else 'no'}")
+        self.decisions[cache_key] = is_indian
+        return is_indian
+    
+    def ask_ollama_batch(self, movies: List[str],
+                         search_results: Optional[Dict[str, str]] = None) -> Dict[str, Union[bool, BaseException]]:
+        """Ask Ollama about several movies in one prompt; movies without an answer map to the error"""
+        search_results = dict(search_results or {})
+        answers: Dict[str, Union[bool, BaseException]] = {
+            m: self.decisions[self._normalize(m)] for m in movies if self._normalize(m) in self.decisions
+        }
+        pending = [m for m in movies if m not in answers]
+        
+        if len(pending) <= 1:
+            return self._ask_ollama_each(pending, search_results, answers)
+        
+        for movie_name in pending:
+            # An empty string is a search that found nothing, not a missing one
+            if search_results.get(movie_name) is None:
+                search_results[movie_name] = self._ddg_search(movie_name)
+        sections = "\n\n".join(
+            f"### Movie {i}: {movie_name}\n{search_results[movie_name]}"
+            for i, movie_name in enumerate(pending, 1)
+        )
+        prompt = f"{len(pending)} movies:\n\n{sections}"
+        
+        try:
+            logger.info(f"  Asking Ollama about {len(pending)} movies in one batch...")
+            logger.debug("  === PROMPT ===\n%s\n  === END PROMPT ===", prompt)
+            
+            payload = {
+                **self._ollama_batch_payload_template,
+                "messages": [self._ollama_batch_payload_template["messages"][0], {"role": "user", "content": prompt}]
+            }
+            response = self.http.post(
+                f"{self.ollama_endpoint}/api/chat",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                # Longer answers need more time, but a hung call must not hold an Ollama slot for long
+                timeout=min(30 * len(pending), 120)
+            )
+            response.raise_for_status()
+            answer = response.json().get('message', {}).get('content', '').strip()
+            logger.debug("  === OLLAMA RESPONSE ===\n%s\n  === END RESPONSE ===", answer)
+            
+            entries = json.loads(answer)
+            if isinstance(entries, dict):
+                entries = entries.get('movies', [])
+            names = [entry.get('name') for entry in entries]
+            if len(entries) == len(pending) and not any(name in pending for name in names):
+                # Model reworded every name; only then trust the requested order
+                names = pending
+            for name, entry in zip(names, entries):
+                # Anything else unmatched or duplicated goes through the single-movie fallback below
+                if name in pending and name not in answers and isinstance(entry.get('indian'), bool):
+                    answers[name] = entry['indian']
+                    self.decisions[self._normalize(name)] = entry['indian']
+                    logger.info(f"  Decision for '{name}': {'yes' if entry['indian'] else 'no'}")
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError) as e:
+            # Ollama is unreachable or failing; asking movie by movie would only fail again
+            logger.error(f"  Error asking Ollama about batch: {e}")
+            for movie_name in pending:
+                answers.setdefault(movie_name, e)
+            return answers
+        except Exception as e:
+            logger.warning(f"  Error in batched Ollama answer, asking one movie at a time: {e}")
+        
+        return self._ask_ollama_each([m for m in pending if m not in answers], search_results, answers)
+    
+    def _ask_ollama_each(self, movies: List[str], search_results: Dict[str, str],
+                         answers: Dict[str, Union[bool, BaseException]]) -> Dict[str, Union[bool, BaseException]]:
+        """Ask Ollama about movies one at a time, recording failures instead of raising"""
+        for movie_name in movies:
             try:
-                print(f"  Asking Ollama about '{movie_name}' (attempt {attempt + 1}/{max_retries})...")
-                print(f"\n  === PROMPT ===")
-                print(f"{prompt}")
-                print(f"  === END PROMPT ===\n")
-                
-                response = requests.post(
-                    f"{self.ollama_endpoint}/api/generate",
-                    json={
-                        "model": self.ollama_model,
-                        "prompt": prompt,
-                        "stream": False
-                    },
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    answer = result.get('response', '').strip()
-                    print(f"\n  === OLLAMA RESPONSE ===")
-                    print(f"{answer}")
-                    print(f"  === END RESPONSE ===\n")
-                    
-                    answer_lower = answer.lower()
-                    
-                    # Check if answer contains yes or no
-                    if 'yes' in answer_lower or 'no' in answer_lower:
-                        decision = 'yes' if 'yes' in answer_lower else 'no'
-                        print(f"  Decision: {decision}")
-                        return 'yes' in answer_lower
-                    else:
-                        print(f"  Invalid response (no 'yes' or 'no' found): {answer}")
-                        if attempt < max_retries - 1:
-                            print(f"  Retrying in 5 seconds...")
-                            time.sleep(5)
-                            continue
-                        else:
-                            print(f"  Max retries reached, treating as 'no'")
-                            return False
-                else:
-                    print(f"  Error from Ollama: {response.status_code}")
-                    if attempt < max_retries - 1:
-                        print(f"  Retrying in 5 seconds...")
-                        time.sleep(5)
-                        continue
-                    else:
-                        return False
-                    
+                answers[movie_name] = self.ask_ollama(movie_name, search_results.get(movie_name))
             except Exception as e:
-                print(f"  Error asking Ollama: {e}")
-                if attempt < max_retries - 1:
-                    print(f"  Retrying in 5 seconds...")
-                    time.sleep(5)
-                    continue
-                else:
-                    return False
-        
-        return False
+                answers[movie_name] = e
+        return answers
     
     def send_notification(self, movie_name: str):
         """Send notification to NTFY"""
         try:
-            print(f"  Sending notification for '{movie_name}'...")
-            response = requests.post(
+            logger.info(f"  Sending notification for '{movie_name}'...")
+            self._throttle()
+            response = self.http.post(
                 self.ntfy_url,
                 data=f"Found Indian movie: {movie_name}",
                 headers={
@@ -178,12 +480,43 @@ Is '{movie_name}' a Bollywood, Indian, or Telugu speaking movie? Answer with jus
             )
             
             if response.status_code == 200:
-                print(f"  Notification sent successfully")
+                logger.info("  Notification sent successfully")
             else:
-                print(f"  Error sending notification: {response.status_code}")
+                logger.error(f"  Error sending notification: {response.status_code}")
                 
         except Exception as e:
-            print(f"  Error sending notification: {e}")
+            logger.error(f"  Error sending notification: {e}")
+    
+    def _get_radarr_index(self) -> Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]]:
+        """Fetch the Radarr library once per run, indexed by lowercased folder name and title"""
+        with self._radarr_lock:
+            if self._radarr_movies is None:
+                self._radarr_movies = self._fetch_radarr_index()
+            return self._radarr_movies
+    
+    def _fetch_radarr_index(self) -> Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]]:
+        """Fetch the whole Radarr library and index it by folder and by title"""
+        self._throttle()
+        response = self.http.get(
+            f"{self.radarr_url}/api/v3/movie",
+            headers={"X-Api-Key": self.radarr_api_key},
+            timeout=30
+        )
+        if response.status_code != 200:
+            logger.error(f"  Error fetching Radarr library: {response.status_code}")
+            return None
+        
+        movies = response.json()
+        # Separate indexes, and lists rather than single movies, so that titles shared by
+        # several films never silently resolve to whichever came last
+        index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {'folder': {}, 'title': {}}
+        for movie in movies:
+            index['title'].setdefault(movie.get('title', '').lower(), []).append(movie)
+            if movie.get('path'):
+                folder = os.path.basename(movie['path'].rstrip('/\\')).lower()
+                index['folder'].setdefault(folder, []).append(movie)
+        logger.info(f"  Loaded {len(movies)} movies from Radarr")
+        return index
     
     def delete_from_radarr(self, movie_name: str) -> bool:
         """Delete movie from Radarr if DELETE is enabled"""
@@ -191,44 +524,36 @@ Is '{movie_name}' a Bollywood, Indian, or Telugu speaking movie? Answer with jus
             return False
             
         if not self.radarr_api_key:
-            print(f"  Radarr API key not set, skipping deletion")
+            logger.warning("  Radarr API key not set, skipping deletion")
             return False
             
         try:
-            print(f"  Searching for movie in Radarr: '{movie_name}'")
-            
-            # Search for the movie in Radarr
-            search_response = requests.get(
-                f"{self.radarr_url}/api/v3/movie",
-                headers={"X-Api-Key": self.radarr_api_key},
-                params={"term": movie_name},
-                timeout=10
-            )
+            logger.debug("  Searching for movie in Radarr: '%s'", movie_name)
             
-            if search_response.status_code != 200:
-                print(f"  Error searching Radarr: {search_response.status_code}")
+            radarr_index = self._get_radarr_index()
+            if radarr_index is None:
                 return False
-                
-            movies = search_response.json()
             
-            # Find matching movie (case-insensitive)
-            matching_movie = None
-            for movie in movies:
-                if movie_name.lower() in movie.get('title', '').lower():
-                    matching_movie = movie
-                    break
-                    
-            if not matching_movie:
-                print(f"  Movie not found in Radarr")
+            # The folder name identifies the movie; a title only does when no other movie shares it
+            candidates = (radarr_index['folder'].get(movie_name.lower())
+                          or radarr_index['title'].get(movie_name.lower(), []))
+            if not candidates:
+                logger.warning(f"  Movie '{movie_name}' not found in Radarr")
                 return False
+            if len(candidates) > 1:
+                ids = ', '.join(str(m.get('id')) for m in candidates)
+                logger.warning(f"  '{movie_name}' matches several Radarr movies (IDs: {ids}), skipping deletion")
+                return False
+            matching_movie = candidates[0]
                 
             movie_id = matching_movie.get('id')
             movie_title = matching_movie.get('title')
             
-            print(f"  Found movie in Radarr: {movie_title} (ID: {movie_id})")
+            logger.info(f"  Found movie in Radarr: {movie_title} (ID: {movie_id})")
             
             # Delete the movie from Radarr
-            delete_response = requests.delete(
+            self._throttle()
+            delete_response = self.http.delete(
                 f"{self.radarr_url}/api/v3/movie/{movie_id}",
                 headers={"X-Api-Key": self.radarr_api_key},
                 params={"deleteFiles": "true", "addImportExclusion": "false"},
@@ -236,60 +561,115 @@ Is '{movie_name}' a Bollywood, Indian, or Telugu speaking movie? Answer with jus
             )
             
             if delete_response.status_code in [200, 204]:
-                print(f"  Successfully deleted movie from Radarr: {movie_title}")
+                logger.info(f"  Successfully deleted movie from Radarr: {movie_title}")
                 return True
             else:
-                print(f"  Error deleting movie from Radarr: {delete_response.status_code}")
+                logger.error(f"  Error deleting movie from Radarr: {delete_response.status_code}")
                 return False
                 
         except Exception as e:
-            print(f"  Error deleting movie from Radarr: {e}")
+            logger.error(f"  Error deleting movie from Radarr: {e}")
             return False
     
-    def process_movies(self):
+    async def classify_batch(self, batch: List[str], search_futures: Dict[str, Future],
+                             ollama_slots: asyncio.Semaphore) -> Dict[str, Union[bool, BaseException]]:
+        """Ask Ollama about one batch of movies once their searches are done"""
+        try:
+            search_results = {m: await asyncio.wrap_future(search_futures[m]) for m in batch}
+            async with ollama_slots:
+                return await asyncio.to_thread(self.ask_ollama_batch, batch, search_results)
+        except Exception as e:
+            return {m: e for m in batch}
+    
+    async def handle_movie(self, movie_name: str, is_indian: Union[bool, BaseException]):
+        """Notify, delete from Radarr and mark as checked, depending on the decision for a movie"""
+        if isinstance(is_indian, BaseException):
+            logger.error(f"  Error checking '{movie_name}', will retry next run: {is_indian}")
+            return
+        
+        if is_indian:
+            logger.info(f"  Identified '{movie_name}' as Indian movie")
+            await asyncio.to_thread(self.send_notification, movie_name)
+            
+            # Try to delete from Radarr if DELETE is enabled
+            if self.delete_enabled:
+                deleted = await asyncio.to_thread(self.delete_from_radarr, movie_name)
+                if deleted:
+                    logger.info(f"  Movie '{movie_name}' deleted from Radarr")
+                else:
+                    logger.warning(f"  Failed to delete movie '{movie_name}' from Radarr")
+        else:
+            logger.info(f"  '{movie_name}' is not an Indian movie")
+        
+        await asyncio.to_thread(self.mark_movie_checked, movie_name)
+    
+    async def process_movies(self):
         """Main processing loop"""
-        movies = self.get_movie_folders()
+        self._radarr_movies = None  # Radarr library may have changed since the last run
+        self._prune_search_cache()
         checked = self.get_checked_movies()
         
-        new_movies = [m for m in movies if m not in checked]
-        print(f"Found {len(new_movies)} new movies to check")
-        print()
+        # Filter while scanning, so the full folder list is never built
+        new_movies = [m for m in self.get_movie_folders() if m not in checked]
+        logger.info(f"Found {len(new_movies)} new movies to check")
         
-        for i, movie in enumerate(new_movies, 1):
-            print(f"Processing movie {i}/{len(new_movies)}: '{movie}'")
-            
-            if self.is_movie_checked(movie):
-                print(f"  Already checked, skipping")
-                continue
-            
-            is_indian = self.ask_ollama(movie)
-            
-            if is_indian:
-                print(f"  Identified as Indian movie")
-                self.send_notification(movie)
-                
-                # Try to delete from Radarr if DELETE is enabled
-                if self.delete_enabled:
-                    deleted = self.delete_from_radarr(movie)
-                    if deleted:
-                        print(f"  Movie deleted from Radarr")
-                    else:
-                        print(f"  Failed to delete movie from Radarr")
-            else:
-                print(f"  Not an Indian movie")
-            
-            self.mark_movie_checked(movie)
-            print()
-            
-            # Small delay to avoid overwhelming services
-            time.sleep(1)
+        if not new_movies:
+            logger.info("Processing complete")
+            return
+        
+        # Titles that already give themselves away skip DuckDuckGo and Ollama entirely
+        prefiltered = {m for m in new_movies if self._indian_regex.search(m)}
+        if prefiltered:
+            logger.info(f"{len(prefiltered)} movies identified from their title alone")
+        known: Dict[str, Union[bool, BaseException]] = {m: True for m in prefiltered}
+        
+        # Other releases of a movie already decided on reuse that decision
+        for movie in new_movies:
+            if movie not in known and self._normalize(movie) in self.decisions:
+                known[movie] = self.decisions[self._normalize(movie)]
+        if len(known) > len(prefiltered):
+            logger.info(f"{len(known) - len(prefiltered)} movies matched remembered decisions")
+        
+        to_classify = [m for m in new_movies if m not in known]
+        batches = [to_classify[i:i + self.ollama_batch_size]
+                   for i in range(0, len(to_classify), self.ollama_batch_size)]
+        
+        # Blocking calls run in threads; size the pool so Ollama calls and movie handling don't starve each other
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.ollama_num_parallel + self.search_workers)
+        )
+        ollama_slots = asyncio.Semaphore(self.ollama_num_parallel)
+        worker_slots = asyncio.Semaphore(self.search_workers)
+        
+        async def handle(movie_name: str, is_indian: Union[bool, BaseException]):
+            async with worker_slots:
+                await self.handle_movie(movie_name, is_indian)
+        
+        async def classify_and_handle(batch: List[str]):
+            answers = await self.classify_batch(batch, search_futures, ollama_slots)
+            await asyncio.gather(*(handle(m, answers[m]) for m in batch))
+        
+        # Searches run ahead in a thread pool, so their latency hides behind the Ollama round-trips,
+        # and each movie is acted upon as soon as its batch is answered
+        with ThreadPoolExecutor(max_workers=self.search_workers) as pool:
+            search_futures = {m: pool.submit(self._ddg_search, m) for m in to_classify}
+            async with asyncio.TaskGroup() as tg:
+                for movie, is_indian in known.items():
+                    tg.create_task(handle(movie, is_indian))
+                for batch in batches:
+                    tg.create_task(classify_and_handle(batch))
         
-        print("Processing complete")
+        if to_classify:
+            self._save_decisions()
+        logger.info("Processing complete")
 
 def main():
-    print("Kapaladaru Movie Checker")
-    print("========================")
-    print()
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s %(levelname)s %(message)s'
+    )
+    logger.info("Kapaladaru Movie Checker")
+    logger.info("========================")
     
     checker = MovieChecker()
     
@@ -298,14 +678,14 @@ def main():
     interval = int(os.environ.get('CHECK_INTERVAL', '3600'))  # Default 1 hour
     
     if run_once:
-        print("Running in single-run mode")
-        checker.process_movies()
+        logger.info("Running in single-run mode")
+        asyncio.run(checker.process_movies())
     else:
-        print(f"Running in continuous mode (interval: {interval} seconds)")
+        logger.info(f"Running in continuous mode (interval: {interval} seconds)")
         while True:
-            checker.process_movies()
-            print(f"\nSleeping for {interval} seconds...")
-            print("-" * 50)
+            asyncio.run(checker.process_movies())
+            logger.info(f"Sleeping for {interval} seconds...")
+            logger.info("-" * 50)
             time.sleep(interval)
 
 if __name__ == "__main__":